@@ -4,6 +4,7 @@ import logging
 
 from service.dal import Project
 from service.models import JSONManifest, JSONFactory
+from service.serializers import loads, dumps
 
 
 # Logging setup
@@ -43,12 +44,12 @@ def main(event, context=None):  # pylint: disable=unused-argument
 
     """
     event = {} if event is None else event
-    logger.info('Service invoked by event: %s', json.dumps(event, indent=2))
+    logger.info('Service invoked by event: %s', dumps(event, indent=True))
 
     # Load all rules
     project = Project()
     rules = [rule for _ in project.resources.values() for rule in _]
-    logger.info('Service loaded rules: %s', json.dumps(rules, indent=2))
+    logger.info('Service loaded rules: %s', dumps(rules, indent=True))
 
     # Confirm event is valid EventBridge -> SQS payload
     loans = []
@@ -63,26 +64,26 @@ def main(event, context=None):  # pylint: disable=unused-argument
 
         # Attempt to load loandata
         try:
-            loans.append(json.loads(record['detail']))
+            loans.append(loads(record['detail']))
         except json.JSONDecodeError:
             logger.error(
                 'Service received invalid event detail- Skipping event'
             )
             continue
 
-    logger.info('Service recieved loans: %s', json.dumps(loans, indent=2))
+    logger.info('Service recieved loans: %s', dumps(loans, indent=True))
 
     # Generate Manifests
     reports = []
     for loan in loans:
         manifest = JSONManifest(loan, rules)
         logger.info(
-            'Generated manifest: %s', json.dumps(manifest.items, indent=2)
+            'Generated manifest: %s', dumps(manifest.items, indent=True)
         )
 
         projection = JSONFactory(manifest).get_projection()
         logger.info(
-            'Generated projection: %s', json.dumps(projection, indent=2)
+            'Generated projection: %s', dumps(projection, indent=True)
         )
 
         reports.extend(projection.get('reports', []))
@@ -1,10 +1,13 @@
 """Service data access layer (dal)."""
 import os
-import json
 import logging
-from copy import copy
+from collections import deque
+from collections.abc import Mapping
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+from service.serializers import loads
+
 
 # Logging setup
 logger = logging.getLogger(__name__)
@@ -12,6 +15,49 @@ logger.setLevel(logging.DEBUG)
 
 
 # Module classes
+class ResourceMapping(Mapping):
+    """Service ResourceMapping class.
+
+    A read-only mapping over the resources of a project, which loads each
+    resource from the local file store on first access.
+
+    Parameters
+    ----------
+    project : Project
+        The project whose resources the mapping will expose.
+
+    """
+
+    def __init__(self, project):
+        self._project = project
+
+    def __contains__(self, name):
+        """Return whether the named resource exists, without loading it."""
+        return name in self._project
+
+    def __getitem__(self, name):
+        """Return the named resource, loading it on first access."""
+        return self._project[name]
+
+    def __iter__(self):
+        """Iterate on the names of all resources."""
+        return iter(self._project.names)
+
+    def __len__(self):
+        """Return the number of resources."""
+        return len(self._project.names)
+
+    def items(self):
+        """Return a view of all resources, loading any not yet loaded."""
+        self._project.load_all()
+        return super().items()
+
+    def values(self):
+        """Return a view of all resource bodies, loading any not yet loaded."""
+        self._project.load_all()
+        return super().values()
+
+
 class Project:
     """Service Project class.
 
@@ -19,48 +65,91 @@ class Project:
     function is to load and return the resources associated with the
     project.
 
+    Resources are only indexed when the project is created. Each resource is
+    loaded on first access, either through `resources` or by indexing the
+    project by name, and kept for later accesses.
+
     Attributes
     ----------
-    resources : dict{str:dict}
-        A dictionary of all resources that are available to the project.
-        These will be available as a dictionary with the filenames as the keys
+    names : tuple[str]
+        The names of all resources that are available to the project.
+    resources : ResourceMapping{str:list}
+        A read-only mapping of all resources that are available to the project.
+        These will be available as a mapping with the filenames as the keys
         and the contents of the json documents as the bodies.
 
     """
 
     # Instance attributes
     @property
-    def resources(self) -> dict:
-        """Return copy of read-only _resources attribute."""
-        return copy(self._resources)
+    def names(self) -> tuple:
+        """Return the names of all indexed resources."""
+        return tuple(self._resources_index)
+
+    @property
+    def resources(self) -> ResourceMapping:
+        """Return read-only, lazily loaded view of the project resources."""
+        return ResourceMapping(self)
 
     def __init__(self):
         # Set project root
         self.root = Path(__file__).parent.parent
 
-        # Load all associated resources
-        self._resources = {}
-        resources_path = self.root / 'resources'
-        for root, _, files in os.walk(resources_path):
-            for file in files:
-                # Skip all non-json documents
-                if '.json' not in file:
-                    logger.warning(
-                        'Service has received a non-valid json document: %s.',
-                        file,
-                    )
-                    continue
-                # Load resources and save into internal _resources attribute
-                name, resources = self._load_resource(root, file)
-                self._resources[name] = resources
+        # Index all associated resources, deferring loading until accessed
+        self._resources, self._resources_index = {}, {}
+        for root, file in self._iter_resources(self.root / 'resources'):
+            # Skip all non-json documents
+            if not file.endswith('.json'):
+                logger.warning(
+                    'Service has received a non-valid json document: %s.',
+                    file,
+                )
+                continue
+            roots, ext = self._parse_roots_ext(root, file)
+            self._resources_index['.'.join(roots)] = (
+                os.path.join(root, file),
+                ext,
+            )
 
-    # Instance methods
-    def _load_resource(self, root: str, file: str):
-        """Load given file as resource."""
-        path = os.path.join(root, file)
-        roots, ext = self._parse_roots_ext(root, file)
-        name = '.'.join(roots)
+    def __contains__(self, name):
+        """Return whether the named resource exists, without loading it."""
+        return name in self._resources_index
 
+    def __getitem__(self, name):
+        """Return the named resource, loading it on first access."""
+        if name not in self._resources:
+            self._resources[name] = self._load_resource(
+                name, *self._resources_index[name]
+            )
+        return self._resources[name]
+
+    # Static methods
+    @staticmethod
+    def _iter_resources(path):
+        """Iterate breadth-first over given directory for resource files."""
+        queue = deque([str(path)])
+        while queue:
+            directory = queue.popleft()
+            try:
+                entries = os.scandir(directory)
+            except OSError as error:
+                logger.error(
+                    'Service could not scan %s due to %s',
+                    directory,
+                    str(error),
+                )
+                continue
+
+            with entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        queue.append(entry.path)
+                    else:
+                        yield directory, entry.name
+
+    @staticmethod
+    def _load_resource(name: str, path: str, ext: str):
+        """Load given file as the named resource."""
         logger.debug(
             'Processing resource %s at %s.',
             '.'.join([name, ext]),
@@ -70,26 +159,49 @@ class Project:
         # Load resource
         resources = []
         try:
-            with open(path) as rules:
-                resources.extend(json.load(rules))
+            resources.extend(loads(Path(path).read_bytes()))
         except Exception as error:  # pylint: disable = broad-except
             logger.error(
                 'Service could not load %s due to %s',
                 str(path),
                 str(error),
             )
-        return name, resources
+        return resources
+
+    # Instance methods
+    def load_all(self):
+        """Load all resources which have not yet been loaded concurrently."""
+        pending = [
+            name
+            for name in self._resources_index
+            if name not in self._resources
+        ]
+        if not pending:
+            return
+
+        with ThreadPoolExecutor(max_workers=min(32, len(pending))) as pool:
+            loaded = pool.map(
+                lambda name: self._load_resource(
+                    name, *self._resources_index[name]
+                ),
+                pending,
+            )
+            for name, resources in zip(pending, loaded):
+                self._resources[name] = resources
 
     def _parse_roots_ext(self, path, file):
         """Parse given file for name and qualified extension."""
-        paths = str(path).replace(str(self.root), '').split('/')
+        try:
+            paths = list(Path(path).relative_to(self.root).parts)
+        except ValueError:
+            return None, None
+
         name, *exts = file.split('.')
         ext = '.'.join(exts) or ''
 
         paths.append(name)
 
-        if len(paths) >= 2:
-            paths = paths[1:]
+        if 'resources' in paths:
             paths.remove('resources')
             return paths, ext
 
@@ -1,8 +1,25 @@
 """Service models and factories."""
 import re
 import logging
-from copy import copy
-from typing import Generator, List, Any
+from collections import OrderedDict
+from functools import lru_cache
+from operator import itemgetter
+from threading import Lock
+from types import MappingProxyType
+from typing import (
+    Any,
+    ClassVar,
+    Dict,
+    Generator,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+)
 
 
 # Logging setup
@@ -10,6 +27,180 @@ logger = logging.getLogger(__name__)
 logger.setLevel(logging.DEBUG)
 
 
+# Module attributes
+_FLATTEN_CACHE: 'OrderedDict[int, Tuple[dict, dict]]' = OrderedDict()
+_FLATTEN_CACHE_LOCK = Lock()
+_FLATTEN_CACHE_SIZE = 4
+_QUOTE_TABLE = str.maketrans('', '', '\'"')
+
+# Deprecated JSONPath pattern, kept for JSONFactory.RE_PAT
+_vals = r"(?:['\"]\s*[\w\.\s-]+\s*['\"]|\d+|true|false|null)"
+_query = fr"(?:@\.\w+\s*==\s*{_vals})"
+
+_stmt_index = r"(?P<index>\d+)"
+_stmt_query = fr"(?P<query>\?\({_query}(?:\s*&&\s*{_query})*\))"
+
+_RE_PAT = re.compile(
+    fr"\.(?P<key>\w+)(?:\[(?:{_stmt_index}|{_stmt_query})\])*"
+)  # Super nasty regex pattern, so split into smaller patterns
+
+_PathKey = Tuple[str, Optional[str], Optional[str]]  # (key, index, query)
+
+
+# Module functions
+def _tokenize_path(path: str) -> Iterator[_PathKey]:
+    """Tokenize a JSONPath into `(key, index, query)` tuples in one pass."""
+    pos, plen = 0, len(path)
+    while pos < plen:
+        if path[pos] != '.':
+            pos += 1
+            continue
+
+        # Read the key following the separator
+        start = pos = pos + 1
+        while pos < plen and (path[pos].isalnum() or path[pos] == '_'):
+            pos += 1
+        key = path[start:pos]
+        if not key:
+            continue
+
+        # Read any trailing index or query statements
+        index = query = None
+        while pos < plen and path[pos] == '[':
+            end = path.find(']', pos)
+            if end < 0:
+                break
+            stmt = path[pos + 1 : end]
+            if stmt.isdecimal():
+                index = stmt
+            elif stmt.startswith('?('):
+                query = stmt
+            pos = end + 1
+
+        yield key, index, query
+
+
+def _split_index(key: str) -> Tuple[str, Optional[int]]:
+    """Split a path key such as `key[0]` into its key and integer index."""
+    pos = key.find('[')
+    if pos < 0 or not key.endswith(']'):
+        return key, None
+
+    index = key[pos + 1 : -1]
+    if not index.isdecimal():
+        return key, None
+    return key[:pos], int(index)
+
+
+def _get_items(reference: dict, key: str, idx: int) -> list:
+    """Return the list at the key in reference, padded to include idx."""
+    if not isinstance(reference.get(key), list):
+        reference[key] = []
+
+    rlen = len(reference[key])
+    if rlen <= idx:
+        for _ in range(idx + 1 - rlen):
+            reference[key].append({})
+    return reference[key]
+
+
+def _resolve_keys(reference: dict, keys: Sequence[str]) -> dict:
+    """Descend through the path keys in reference, creating as needed.
+
+    Missing values, and values which are not dicts such as None, are replaced
+    with empty dicts so the path can always be descended into.
+    """
+    for key in keys:
+        key, idx = _split_index(key)
+        if idx is not None:
+            items = _get_items(reference, key, idx)
+            if not isinstance(items[idx], dict):
+                items[idx] = {}
+            reference = items[idx]
+        else:
+            if not isinstance(reference.get(key), dict):
+                reference[key] = {}
+            reference = reference[key]
+    return reference
+
+
+def _insert_keys(reference: dict, keys: Sequence[str], value: Any) -> None:
+    """Insert the value at the path keys in reference."""
+    if not keys:
+        return
+
+    reference = _resolve_keys(reference, keys[:-1])
+    key, idx = _split_index(keys[-1])
+    if idx is not None:
+        _get_items(reference, key, idx)[idx] = value
+    else:
+        reference[key] = value
+
+
+def _parse_term(term: str) -> str:
+    """Strip the `@.` prefix and any quotes from a query condition term."""
+    term = term.strip()
+    if term.startswith('@.'):
+        term = term[2:]
+    return term.translate(_QUOTE_TABLE).strip()
+
+
+@lru_cache(maxsize=4096)
+def _parse_path(path: str) -> Tuple[_PathKey, ...]:
+    """Parse a JSONPath into `(key, index, query)` tuples, cached per path."""
+    return tuple(_tokenize_path(path))
+
+
+@lru_cache(maxsize=4096)
+def _parse_conditions(query: str) -> Tuple[Tuple[str, str], ...]:
+    """Parse the key-value conditions from a JSONPath query statement."""
+    conditions = []
+    for condition in query[2:-1].split('&&'):
+        key, _, val = condition.partition('==')
+        conditions.append((_parse_term(key), _parse_term(val)))
+    return tuple(conditions)
+
+
+@lru_cache(maxsize=128)
+def _index_rules(pairs: Tuple[Tuple[str, str], ...]) -> Tuple[dict, frozenset]:
+    """Index rule positions and targets by source, collect query targets."""
+    source_to_targets: Dict[str, List[Tuple[int, str]]] = {}
+    query_targets: Set[str] = set()
+    for position, (source, target) in enumerate(pairs):
+        source_to_targets.setdefault(source, []).append((position, target))
+        if target is not None and '?' in target:
+            query_targets.add(target)
+
+    rule_index = {
+        source: tuple(targets) for source, targets in source_to_targets.items()
+    }
+    return rule_index, frozenset(query_targets)
+
+
+def _flatten_cached(data: dict) -> dict:
+    """Flatten the given data, reusing the result for the same object.
+
+    Entries keep a reference to their data object, so an id cannot be reused
+    by another object while it is cached. The cache is kept deliberately
+    small, to the most recently used `_FLATTEN_CACHE_SIZE` objects, so it
+    does not hold on to many large documents, and is guarded by a lock.
+    """
+    key = id(data)
+    with _FLATTEN_CACHE_LOCK:
+        entry = _FLATTEN_CACHE.get(key)
+        if entry is not None and entry[0] is data:
+            _FLATTEN_CACHE.move_to_end(key)
+            return entry[1]
+
+    # Flatten outside the lock, so other threads are not held up meanwhile
+    fdata = dict(JSONManifest.flatten(data))
+    with _FLATTEN_CACHE_LOCK:
+        _FLATTEN_CACHE[key] = (data, fdata)
+        while len(_FLATTEN_CACHE) > _FLATTEN_CACHE_SIZE:
+            _FLATTEN_CACHE.popitem(last=False)
+    return fdata
+
+
 # Model objects
 class JSONManifest:
     """JSONManifest object.
@@ -22,6 +213,10 @@ class JSONManifest:
     if the `source` values matches the path for a value in the data, then
     the manifest will output the `target` along with the value.
 
+    The flattened data is cached per data object and shared between
+    manifests, so the data must not be mutated once it has been passed in;
+    manifests created from a mutated object will see stale values.
+
     Parameters
     ----------
     data : dict{str:any}
@@ -33,46 +228,96 @@ class JSONManifest:
 
     Attributes
     ----------
-    data : dict{str:any}
-        The ingested data.
-    rules : list[dict]
+    data : MappingProxyType{str:any}
+        A read-only view of the ingested data.
+    rules : tuple[dict]
         The ingested rules.
     items : dict{str:any}
         A dictionary where the keys are the target paths and the values are
         the values, after the transformation has occurred.
+    query_targets : frozenset{str}
+        The target paths from the ingested rules which include a query.
 
     """
 
+    __slots__ = (
+        '_data',
+        '_rules',
+        '_fdata',
+        '_pairs',
+        '_rule_index',
+        '_query_targets',
+    )
+
     # Instance attributes
     @property
-    def data(self) -> dict:
-        """Return a copy of the internal read-only _data attributes."""
-        return copy(self._data)
+    def data(self) -> MappingProxyType:
+        """Return a read-only view of the internal _data attribute."""
+        return MappingProxyType(self._data)
 
     @property
-    def rules(self) -> list:
-        """Return a copy of the internal read-only _rules attribute."""
-        return copy(self._rules)
+    def rules(self) -> tuple:
+        """Return the internal read-only _rules attribute."""
+        return self._rules
 
     @property
-    def items(self) -> list:
+    def items(self) -> dict:
         """Return a dictionary of the mapped data, per the given rules."""
         return dict(iter(self))
 
-    def __init__(self, data: dict = None, rules: list = None):
+    @property
+    def query_targets(self) -> frozenset:
+        """Return the set of target paths which include a query."""
+        return self._query_targets
+
+    def __init__(
+        self, data: Optional[dict] = None, rules: Optional[list] = None
+    ):
         data = {} if data is None else data
         rules = [] if rules is None else rules
-        self._data, self._rules = data, rules
+        self._data, self._rules = data, tuple(rules)
 
-        # Flatten source data for faster parsing
-        self._fdata = dict(self.flatten(self._data))
+        # Flattened source data, built on first iteration
+        self._fdata: Optional[dict] = None
+
+        # Cache source and target pairs, in rule order, and index them by
+        # source, shared between manifests with the same rules
+        self._pairs = tuple(
+            (rule.get('source'), rule.get('target')) for rule in rules
+        )
+        self._rule_index, self._query_targets = _index_rules(self._pairs)
 
     def __iter__(self):
         """Iterate on the rules and items, yielding only those which match."""
-        for rule in self._rules:
-            for path, value in self._fdata.items():
-                if rule.get('source') == path:
-                    yield rule.get('target'), value
+        # Flatten source data for faster parsing, reusing prior results
+        if self._fdata is None:
+            self._fdata = _flatten_cached(self._data)
+
+        for source, target in self._pairs:
+            if source in self._fdata:
+                yield target, self._fdata[source]
+
+    # Instance methods
+    def stream(self) -> Generator:
+        """Iterate on the data and rules in a single pass.
+
+        Unlike iterating on the manifest itself, the flattened data is never
+        materialized: each value is matched against the rules as the data is
+        walked, so matches are yielded in the order of the data rather than
+        the order of the rules. Each match carries the position of its rule,
+        so callers can restore the rule order.
+
+        Returns
+        -------
+        Generator
+            Returns a generator, which when iterated on, will yield the rule
+            position, target path and value for every rule which matches the
+            data.
+
+        """
+        for path, value in self.flatten(self._data):
+            for position, target in self._rule_index.get(path, ()):
+                yield position, target, value
 
     # Static methods
     @staticmethod
@@ -92,23 +337,25 @@ class JSONManifest:
             data and the keys are the valid JSONPaths to those values.
 
         """
-
-        def iter_child(cdata: Any, keys: List[str] = None):
-            keys = [] if keys is None else keys
+        # Walk iteratively, pushing children in reverse to preserve ordering
+        stack: List[Tuple[Any, str]] = [(data, '$')]
+        while stack:
+            cdata, prefix = stack.pop()
 
             if isinstance(cdata, dict):
-                for key, value in cdata.items():
-                    yield from iter_child(value, keys + [key])
+                stack.extend(
+                    (value, f'{prefix}.{key}')
+                    for key, value in reversed(cdata.items())
+                )
 
             elif isinstance(cdata, list):
-                for idx, value in enumerate(cdata):
-                    key = f'{keys[-1]}[{str(idx)}]'
-                    yield from iter_child(value, keys[:-1] + [key])
+                stack.extend(
+                    (cdata[idx], f'{prefix}[{idx}]')
+                    for idx in reversed(range(len(cdata)))
+                )
 
             else:
-                yield '.'.join(keys), cdata
-
-        yield from iter_child(data, ['$'])
+                yield prefix, cdata
 
 
 # Factory objects
@@ -128,29 +375,28 @@ class JSONFactory:
     Attributes
     ----------
     RE_PAT : re.Pattern
-        A regex pattern which parses JSONPaths for queries.
+        A regex pattern which parses JSONPaths for queries. Deprecated, as
+        `parse_path` no longer uses it; kept for backwards compatibility.
     RE_IDX : dict{str:str}
         A dictionary which represents the group names of `RE_PAT`.
+        Deprecated along with `RE_PAT`.
 
     """
 
-    # Class attributes
-    _vals = r"(?:['\"]\s*[\w\.\s-]+\s*['\"]|\d+|true|false|null)"
-    _query = fr"(?:@\.\w+\s*==\s*{_vals})"
-
-    _stmt_index = r"(?P<index>\d+)"
-    _stmt_query = fr"(?P<query>\?\({_query}(?:\s*&&\s*{_query})*\))"
+    __slots__ = ('_manifest',)
 
-    RE_PAT = re.compile(
-        fr"\.(?P<key>\w+)(?:\[(?:{_stmt_index}|{_stmt_query})\])*"
-    )  # Super nasty regex pattern, so split into smaller patterns
-    RE_IDX = RE_PAT.groupindex
+    # Class attributes
+    RE_PAT: ClassVar[re.Pattern] = _RE_PAT
+    RE_IDX: ClassVar[Mapping[str, int]] = _RE_PAT.groupindex
 
     # Class methods
     @classmethod
-    def parse_path(cls, path):
+    def parse_path(cls, path: str) -> Tuple[_PathKey, ...]:
         """Parse paths, indices, and queries from a valid JSONPath.
 
+        Results are cached per path, so the returned value is immutable and
+        shared between callers.
+
         Parameters
         ----------
         path : str
@@ -158,20 +404,17 @@ class JSONFactory:
 
         Returns
         -------
-        dict{str:str}
-            Returns a dictionary where the keys and values are the group names
-            and the result, if any otherwise None, found from the regex
-            operation.
+        tuple(tuple(str, str, str))
+            Returns a tuple of `(key, index, query)` tuples, one for each key
+            in the path, where the index and query are None if not given.
 
         """
-        matches = []
-        for match in cls.RE_PAT.findall(path):
-            match = [_ if _ != '' else None for _ in match]
-            matches.append(dict(zip(cls.RE_IDX, match)))
-        return matches
+        return _parse_path(path)
 
     @classmethod
-    def insert_value(cls, path, value, record=None):
+    def insert_value(
+        cls, path: str, value: Any, record: Optional[dict] = None
+    ) -> dict:
         """Insert a value at a specfied path into the given record.
 
         Parameters
@@ -191,53 +434,17 @@ class JSONFactory:
         """
         record = {} if record is None else record
 
-        def _get_index(key):
-            matches = re.search(r"\[(?P<index>\d+)\]", key)
-            if matches:
-                return (
-                    key.replace(matches.group(), ''),
-                    int(matches.group('index')),
-                )
-            return None, None
-
-        def _iter(keys=None, reference=None):
-            keys = [] if keys is None else keys
-            reference = {} if reference is None else reference
-
-            if not keys:
-                return
-
-            key = keys.pop(0)
-            index = _get_index(key)
-
-            if index:
-                key, idx = index
-                if not key in reference:
-                    reference[key] = []
-
-                rlen = len(reference[key])
-                if rlen <= idx:
-                    for _ in range(idx + 1 - rlen):
-                        reference[key].append({})
-
-                ref = reference[key][idx]
-                reference[key][idx] = _iter(keys, ref) if keys else value
-
-            else:
-                ref = reference.get(key, {})
-                reference[key] = _iter(keys, ref) if keys else value
-
-            return reference
-
         path_keys = path.split('.')
         if path_keys[0] == '$':
             path_keys.pop(0)
 
-        record = _iter(path_keys, record)
+        _insert_keys(record, path_keys, value)
         return record
 
     @classmethod
-    def insert_query(cls, path, value, record=None):
+    def insert_query(
+        cls, path: str, value: Any, record: Optional[dict] = None
+    ) -> dict:
         """Insert a value at a specfied path into the given record.
 
         This method is very similar to insert_value except it assumes the
@@ -262,14 +469,16 @@ class JSONFactory:
         """
         record = {} if record is None else record
 
-        def _iter(keys=None, reference=None):
-            keys = [] if keys is None else keys
+        path_keys = cls.parse_path(path)
+        nkeys = len(path_keys)
+
+        def _iter(pos: int = 0, reference: Optional[dict] = None) -> dict:
             reference = {} if reference is None else reference
-            key, index, query = keys.pop(0).values()
+            key, index_str, query = path_keys[pos]
+            pos += 1
 
             # convert index to integer, if exists
-            if index is not None:
-                index = int(index)
+            index = int(index_str) if index_str is not None else None
 
             # 4 possible cases:
             #    (a) query w/ index :     process query and update only that index from result
@@ -278,17 +487,7 @@ class JSONFactory:
             #    (d) only a key given :   treat like a dict key and update that value
 
             if query is not None:
-                conditions = [
-                    tuple(
-                        t.strip()
-                        .replace('@.', '')
-                        .replace('\'', '')
-                        .replace('"', '')
-                        .strip()
-                        for t in s.strip().split('==')
-                    )
-                    for s in query[2:-1].split('&&')
-                ]
+                conditions = _parse_conditions(query)
 
                 if not key in reference:
                     reference[key] = []
@@ -308,7 +507,7 @@ class JSONFactory:
 
                     ref = reference[key][indices[index]]
                     reference[key][indices[index]] = (
-                        _iter(keys, ref) if keys else value
+                        _iter(pos, ref) if pos < nkeys else value
                     )
                 else:
                     if not indices:
@@ -318,7 +517,7 @@ class JSONFactory:
                     for idx in indices:
                         ref = reference[key][idx]
                         reference[key][idx] = (
-                            _iter(list(keys), ref) if keys else value
+                            _iter(pos, ref) if pos < nkeys else value
                         )
 
             elif index is not None:
@@ -333,16 +532,17 @@ class JSONFactory:
                         )  # Change to type of child element
 
                 ref = reference[key][index]
-                reference[key][index] = _iter(keys, ref) if keys else value
+                reference[key][index] = (
+                    _iter(pos, ref) if pos < nkeys else value
+                )
 
             else:
                 ref = reference.get(key, {})
-                reference[key] = _iter(keys, ref) if keys else value
+                reference[key] = _iter(pos, ref) if pos < nkeys else value
 
             return reference
 
-        path_keys = cls.parse_path(path)
-        record = _iter(path_keys, record)
+        record = _iter(0, record)
 
         return record
 
@@ -351,7 +551,7 @@ class JSONFactory:
         self._manifest = manifest
 
     # Instance methods
-    def get_projection(self):
+    def get_projection(self) -> dict:
         """Generate the projection for the given manifest.
 
         Returns
@@ -360,15 +560,42 @@ class JSONFactory:
             Returns the generated projected json for the given manifest.
 
         """
-        queries, record = [], {}
-        for path, value in self._manifest:
+        return self._project(self._manifest)
+
+    def get_projection_streaming(self) -> dict:
+        """Generate the projection for the given manifest in a single pass.
+
+        The manifest data is walked once without flattening it up front, and
+        only the matched values are kept. Matches are then inserted in rule
+        order, as queries without an index update every matching element and
+        later rules overwrite earlier ones, so the projection is identical to
+        `get_projection`.
+
+        Returns
+        -------
+        dict{str:any}
+            Returns the generated projected json for the given manifest.
+
+        """
+        matches = sorted(self._manifest.stream(), key=itemgetter(0))
+        return self._project((target, value) for _, target, value in matches)
+
+    def _project(self, items: Iterable[Tuple[str, Any]]) -> dict:
+        """Generate a projection from the given target paths and values."""
+        queries: List[Tuple[str, Any]] = []
+        record: dict = {}
+        query_targets = self._manifest.query_targets
+        for path, value in items:
 
             # Prioritize non-queries before queries
-            if '?' in path:
+            if path in query_targets:
                 queries.append((path, value))
                 continue
 
-            self.insert_value(path, value, record)
+            path_keys = path.split('.')
+            if path_keys[0] == '$':
+                path_keys.pop(0)
+            _insert_keys(record, path_keys, value)
 
         for path, value in queries:
             self.insert_query(path, value, record)
@@ -0,0 +1,118 @@
+"""Service JSON serializers."""
+import re
+import json
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None  # type: ignore[assignment]
+
+
+# Module attributes
+# orjson silently parses integers outside the 64-bit range as floats, so any
+# document with a digit run this long is left to the standard library
+_RE_WIDE_INT = re.compile(r'\d{19,}')
+_RE_WIDE_INT_BYTES = re.compile(rb'\d{19,}')
+
+
+# Module functions
+def _orjson_dumps(obj, indent):
+    """Serialize with orjson, or return None if json must be used instead."""
+    option = orjson.OPT_INDENT_2 if indent else None
+    try:
+        data = orjson.dumps(obj, option=option)
+    except TypeError:  # Includes orjson.JSONEncodeError, e.g. for wide ints
+        return None
+
+    # orjson writes NaN and Infinity as null, so leave any document which
+    # may contain them to json
+    if b'null' in data:
+        return None
+    return data
+
+
+def loads(data):
+    """Deserialize the given JSON document.
+
+    Uses `orjson` when it is installed, otherwise falls back to the standard
+    library `json` module. The standard library is also used for documents
+    which orjson cannot represent faithfully: those with integers wider than
+    64 bits, or with `NaN` and `Infinity` values.
+
+    Parameters
+    ----------
+    data : str or bytes
+        The JSON document to deserialize.
+
+    Returns
+    -------
+    any
+        Returns the deserialized python object.
+
+    """
+    if orjson is not None:
+        pattern = _RE_WIDE_INT if isinstance(data, str) else _RE_WIDE_INT_BYTES
+        if not pattern.search(data):
+            try:
+                return orjson.loads(data)
+            except orjson.JSONDecodeError:
+                pass  # Retry with json, which accepts NaN and Infinity
+    return json.loads(data)
+
+
+def dumps(obj, indent=False):
+    """Serialize the given object as a JSON document.
+
+    Uses `orjson` when it is installed, otherwise falls back to the standard
+    library `json` module. The standard library is also used for objects
+    which orjson cannot serialize faithfully: integers wider than 64 bits,
+    and `NaN` or `Infinity` values, which orjson would write as `null`.
+
+    Parameters
+    ----------
+    obj : any
+        The python object to serialize.
+    indent : bool
+        Whether the document should be indented by two spaces.
+
+    Returns
+    -------
+    str
+        Returns the serialized JSON document.
+
+    """
+    if orjson is not None:
+        data = _orjson_dumps(obj, indent)
+        if data is not None:
+            return data.decode()
+    return json.dumps(obj, indent=2 if indent else None)
+
+
+def dump(obj, file, indent=False):
+    """Serialize the given object as a JSON document into a text file.
+
+    Follows the same serializer choice as `dumps`. With the standard library
+    the document is streamed into the file rather than being built as a
+    single string first.
+
+    Parameters
+    ----------
+    obj : any
+        The python object to serialize.
+    file : TextIO
+        The writable text file object to serialize into.
+    indent : bool
+        Whether the document should be indented by two spaces.
+
+    """
+    if orjson is not None:
+        data = _orjson_dumps(obj, indent)
+        if data is not None:
+            file.write(data.decode())
+            return
+    json.dump(
+        obj,
+        file,
+        indent=2 if indent else None,
+        separators=(',', ': ') if indent else None,
+    )
@@ -0,0 +1,94 @@
+import os
+import sys
+import json
+
+import pytest
+
+# Update Path
+sys.path.insert(
+    0, os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+)
+
+from service.dal import Project  # noqa: E402
+from service.models import JSONManifest, JSONFactory  # noqa: E402
+
+
+def load_loandata():
+    """Load the local testing loan data."""
+    path = os.path.join(os.path.dirname(__file__), "loandata.json")
+    with open(path) as file:
+        return json.load(file)
+
+
+@pytest.mark.parametrize(
+    'data, rules',
+    [
+        (
+            {'l': [1, 2], 'y': {'z': 2}},
+            [
+                {'source': '$.l[0]', 'target': "$.r[?(@.t == 'A')].v"},
+                {'source': '$.y.z', 'target': "$.r[?(@.t == 'A')][1].w"},
+                {'source': '$.l[1]', 'target': "$.r[?(@.t == 'B')].v"},
+            ],
+        ),
+        (
+            {'x': 1, 'y': 2},
+            [
+                {'source': '$.x', 'target': '$.t'},
+                {'source': '$.y', 'target': '$.t'},
+                {'source': '$.x', 'target': '$.t'},
+            ],
+        ),
+        (
+            load_loandata(),
+            [rule for rules in Project().resources.values() for rule in rules],
+        ),
+    ],
+)
+def test_projection_streaming(data, rules):
+    """Streaming projections match projections, including their ordering."""
+    manifest = JSONManifest(data, rules)
+    expected = JSONFactory(manifest).get_projection()
+    projection = JSONFactory(manifest).get_projection_streaming()
+
+    assert projection == expected
+    assert json.dumps(projection) == json.dumps(expected)
+
+
+@pytest.mark.parametrize(
+    'path, record, expected',
+    [
+        ('$.a.b', None, {'a': {'b': 1}}),
+        ('$.a.b', {'a': None}, {'a': {'b': 1}}),
+        ('$.a.b', {'a': 2}, {'a': {'b': 1}}),
+        ('$.a[1].b', {'a': None}, {'a': [{}, {'b': 1}]}),
+        ('$.a[²].b', None, {'a[²]': {'b': 1}}),
+    ],
+)
+def test_insert_value(path, record, expected):
+    """Values are inserted, replacing values which cannot be descended."""
+    assert JSONFactory.insert_value(path, 1, record) == expected
+
+
+@pytest.mark.parametrize(
+    'targets',
+    [
+        ['$.a.b[0].y', '$.a.b.x', '$.a.b[0].z'],
+        ['$.a.b.y', '$.a[0].c.x', '$.a.b.z'],
+    ],
+)
+def test_projection_replaced_parents(targets):
+    """Projections match inserting each value in turn with insert_value."""
+    data = {'v{}'.format(i): i for i in range(len(targets))}
+    rules = [
+        {'source': '$.v{}'.format(i), 'target': target}
+        for i, target in enumerate(targets)
+    ]
+
+    expected: dict = {}
+    for i, target in enumerate(targets):
+        JSONFactory.insert_value(target, i, expected)
+
+    manifest = JSONManifest(data, rules)
+    assert JSONFactory(manifest).get_projection() == expected
+    assert JSONFactory(manifest).get_projection_streaming() == expected
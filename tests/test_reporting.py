@@ -1,7 +1,8 @@
 import os
 import sys
-import json
 import logging
+from functools import lru_cache
+from pathlib import Path
 
 # Initialize Logging
 for handler in logging.root.handlers[:]:
@@ -11,21 +12,30 @@ logging.basicConfig(level=logging.DEBUG, filename="output.log", filemode="w")
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.DEBUG)
 
+# Update Path
+sys.path.insert(
+    0, os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+)
+
+from service.serializers import loads, dumps, dump  # noqa: E402
+
+
+@lru_cache(maxsize=None)
+def _load_env(path, mtime):  # pylint: disable=unused-argument
+    """Load the environment file at path, cached per modification time."""
+    return loads(Path(path).read_bytes())
+
+
 # Import all environment variables
 env_path = os.path.join(os.path.dirname(__file__), "dev.env")
 try:
-    with open(env_path) as f:
-        env_data = json.load(f)
-    os.environ.update(env_data)
+    env_data = _load_env(env_path, os.stat(env_path).st_mtime_ns)
+    if not env_data.items() <= os.environ.items():
+        os.environ.update(env_data)
 except Exception as error:  # pylint: disable=broad-except
     logger.exception("Could not load dev.env due to %s", str(error))
 os.environ['local'] = 'true'
 
-# Update Path
-sys.path.insert(
-    0, os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
-)
-
 
 def generate_event(detail=None):
     """Generate a mock EventBridge event with the given detail."""
@@ -35,7 +45,7 @@ def generate_event(detail=None):
             {
                 'source': 'testing.local',
                 'detail-type': 'Local Testing',
-                'detail': json.dumps(detail),
+                'detail': dumps(detail),
             }
         ]
     }
@@ -44,10 +54,12 @@ def generate_event(detail=None):
 if __name__ == '__main__':
     from handler import main
 
-    with open('loandata.json') as file:
-        event = generate_event(json.load(file))
+    with open('loandata.json', 'rb') as file:
+        event = generate_event(loads(file.read()))
     response = main(event)
 
-    logger.info('Reports: %s', json.dumps(response, indent=2))
-    with open('reports.json', 'w') as reports:
-        json.dump(response, reports, indent=2)
+    logger.info('Reports: %s', dumps(response, indent=True))
+    with open(
+        'reports.json', 'w', encoding='utf-8', buffering=1 << 20
+    ) as reports:
+        dump(response, reports, indent=True)
@@ -0,0 +1,75 @@
+import io
+import os
+import sys
+import json
+
+import pytest
+
+# Update Path
+sys.path.insert(
+    0, os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+)
+
+from service import serializers  # noqa: E402
+from service.serializers import loads, dumps, dump  # noqa: E402
+
+
+WIDE_INT = 123456789012345678901234
+
+
+@pytest.fixture(params=['orjson', 'json'])
+def backend(request, monkeypatch):
+    """Run the test with and without orjson installed."""
+    if request.param == 'json':
+        monkeypatch.setattr(serializers, 'orjson', None)
+    return request.param
+
+
+@pytest.mark.parametrize('data', [
+    '{"loanId": 123456789012345678901234}',
+    b'{"loanId": 123456789012345678901234}',
+])
+def test_loads_wide_int(backend, data):
+    """Integers wider than 64 bits are parsed exactly."""
+    assert loads(data) == {'loanId': WIDE_INT}
+
+
+@pytest.mark.parametrize('data', ['[NaN]', b'[Infinity, -Infinity]'])
+def test_loads_non_finite(backend, data):
+    """NaN and Infinity are parsed as with json."""
+    assert repr(loads(data)) == repr(json.loads(data))
+
+
+@pytest.mark.parametrize('obj', [
+    {'loanId': WIDE_INT},
+    {'rate': float('nan')},
+    {'rate': float('inf'), 'cap': float('-inf')},
+    {'loanId': 1, 'name': 'A', 'rate': 2.5, 'flag': None, 'tags': []},
+])
+@pytest.mark.parametrize('indent', [False, True])
+def test_dumps_round_trip(backend, obj, indent):
+    """Serialized documents parse back to the same objects."""
+    text = dumps(obj, indent=indent)
+    assert repr(json.loads(text)) == repr(obj)
+
+
+@pytest.mark.parametrize('obj, expected', [
+    ({'loanId': WIDE_INT}, '{"loanId": 123456789012345678901234}'),
+    ({'rate': float('nan')}, '{"rate": NaN}'),
+    ({'rate': float('-inf')}, '{"rate": -Infinity}'),
+])
+def test_dumps_matches_json(backend, obj, expected):
+    """Wide integers and non-finite floats are serialized as with json."""
+    assert dumps(obj) == expected
+
+
+@pytest.mark.parametrize('obj', [
+    {'loanId': WIDE_INT, 'rate': float('nan')},
+    [{'loanId': 1, 'flag': None}],
+])
+def test_dump(backend, obj):
+    """Documents are written indented into text files."""
+    file = io.StringIO()
+    dump(obj, file, indent=True)
+    assert repr(json.loads(file.getvalue())) == repr(obj)
+    assert '\n  ' in file.getvalue()